@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import argparse
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from src.config import load_microgrid_config, resolve_profile_csv_override
+from src.config import (
+    MicrogridConfig,
+    load_microgrid_config,
+    resolve_profile_csv_override,
+    with_profile_csv,
+)
 from src.envs.microgrid_env import MicrogridEnv
+from src.evaluation.async_runner import PolicySpec, build_policy_fn_from_spec
 from src.evaluation.runner import (
-    baseline_policy_fn,
+    EvaluationSummary,
     evaluate_policy,
-    load_rl_policy_fn,
-    random_policy_fn,
+    evaluate_policy_batched,
+    make_eval_envs,
 )
 
 
@@ -32,6 +41,17 @@ def build_arg_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--episodes", type=int, default=20)
     parser.add_argument("--seed-start", type=int, default=1500)
+    parser.add_argument(
+        "--n-envs",
+        type=int,
+        default=1,
+        help="Environment copies stepped in lockstep per evaluation wave.",
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Evaluate policies one after another in this process.",
+    )
     parser.add_argument("--no-safety", action="store_true")
     parser.add_argument(
         "--rl-algo",
@@ -55,6 +75,58 @@ def _print_result(name: str, summary) -> None:
     )
 
 
+def _evaluate_spec(
+    cfg: MicrogridConfig,
+    spec: PolicySpec,
+    policy_name: str,
+    episodes: int,
+    seed_start: int,
+    use_safety: bool,
+    n_envs: int,
+) -> EvaluationSummary:
+    env = MicrogridEnv(cfg)
+    policy_fn = build_policy_fn_from_spec(spec, env)
+    if n_envs > 1:
+        return evaluate_policy_batched(
+            envs=make_eval_envs(cfg, min(n_envs, episodes)),
+            policy_fn=policy_fn,
+            policy_name=policy_name,
+            episodes=episodes,
+            seed_start=seed_start,
+            use_safety=use_safety,
+        )
+    return evaluate_policy(
+        env=env,
+        policy_fn=policy_fn,
+        policy_name=policy_name,
+        episodes=episodes,
+        seed_start=seed_start,
+        use_safety=use_safety,
+    )
+
+
+def _evaluate_spec_worker(
+    cfg_bytes: bytes,
+    spec: PolicySpec,
+    policy_name: str,
+    episodes: int,
+    seed_start: int,
+    use_safety: bool,
+    n_envs: int,
+) -> EvaluationSummary:
+    # Keep workers from oversubscribing cores when torch is in play.
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    if spec[0] in {"sac", "ddpg"}:
+        try:
+            import torch
+
+            torch.set_num_threads(1)
+        except ImportError:
+            pass
+    cfg: MicrogridConfig = pickle.loads(cfg_bytes)
+    return _evaluate_spec(cfg, spec, policy_name, episodes, seed_start, use_safety, n_envs)
+
+
 def main() -> None:
     parser = build_arg_parser()
     args = parser.parse_args()
@@ -66,49 +138,54 @@ def main() -> None:
         data_splits_config_path=args.data_splits_config,
     )
     if profile_csv_override:
-        cfg.environment.profile_csv = profile_csv_override
+        cfg = with_profile_csv(cfg, profile_csv_override)
     use_safety = not args.no_safety
 
-    random_env = MicrogridEnv(cfg)
-    baseline_env = MicrogridEnv(cfg)
-
-    random_summary = evaluate_policy(
-        env=random_env,
-        policy_fn=random_policy_fn(random_env),
-        policy_name="random",
-        episodes=args.episodes,
-        seed_start=args.seed_start,
-        use_safety=use_safety,
-    )
-    baseline_summary = evaluate_policy(
-        env=baseline_env,
-        policy_fn=baseline_policy_fn(cfg),
-        policy_name="baseline",
-        episodes=args.episodes,
-        seed_start=args.seed_start,
-        use_safety=use_safety,
-    )
-
-    print("Benchmark results:")
-    _print_result("random", random_summary)
-    _print_result("baseline", baseline_summary)
-
+    entries: list[tuple[str, PolicySpec]] = [
+        ("random", ("random", None)),
+        ("baseline", ("baseline", None)),
+    ]
     if args.rl_algo or args.rl_model_path:
         if not args.rl_algo or not args.rl_model_path:
             raise SystemExit("--rl-algo and --rl-model-path must be provided together.")
         model_path = Path(args.rl_model_path)
         if not model_path.exists():
             raise SystemExit(f"Model path not found: {model_path}")
-        rl_env = MicrogridEnv(cfg)
-        rl_summary = evaluate_policy(
-            env=rl_env,
-            policy_fn=load_rl_policy_fn(args.rl_algo, model_path),
-            policy_name=f"{args.rl_algo}:{model_path.name}",
-            episodes=args.episodes,
-            seed_start=args.seed_start,
-            use_safety=use_safety,
+        entries.append(
+            (f"{args.rl_algo}:{model_path.name}", (args.rl_algo, str(model_path)))
         )
-        _print_result(args.rl_algo, rl_summary)
+
+    if args.serial:
+        summaries = [
+            _evaluate_spec(
+                cfg, spec, name, args.episodes, args.seed_start, use_safety, args.n_envs
+            )
+            for name, spec in entries
+        ]
+    else:
+        # Policy evaluations are independent experiments; run them concurrently
+        # and print in deterministic order once all complete.
+        cfg_bytes = pickle.dumps(cfg)
+        with ProcessPoolExecutor(max_workers=len(entries)) as pool:
+            futures = [
+                pool.submit(
+                    _evaluate_spec_worker,
+                    cfg_bytes,
+                    spec,
+                    name,
+                    args.episodes,
+                    args.seed_start,
+                    use_safety,
+                    args.n_envs,
+                )
+                for name, spec in entries
+            ]
+            summaries = [future.result() for future in futures]
+
+    print("Benchmark results:")
+    for (name, _), summary in zip(entries, summaries):
+        label = name.split(":")[0]
+        _print_result(label, summary)
 
 
 if __name__ == "__main__":
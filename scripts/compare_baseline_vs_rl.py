@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
-from src.config import load_microgrid_config, resolve_profile_csv_override
+from src.config import load_microgrid_config, resolve_profile_csv_override, with_profile_csv
 from src.envs.microgrid_env import MicrogridEnv
-from src.evaluation.comparison import compare_policy_summaries
+from src.evaluation.comparison import ComparisonReport, compare_policy_summaries
+from src.evaluation.reporting import write_json_report
 from src.evaluation.runner import (
     baseline_policy_fn,
     evaluate_policy,
+    evaluate_policy_batched,
     load_rl_policy_fn,
+    make_eval_envs,
 )
 
 
@@ -44,6 +46,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--episodes", type=int, default=20)
     parser.add_argument("--seed-start", type=int, default=2000)
+    parser.add_argument(
+        "--n-envs",
+        type=int,
+        default=1,
+        help="Environment copies stepped in lockstep per evaluation wave.",
+    )
     parser.add_argument("--no-safety", action="store_true")
     parser.add_argument(
         "--json-out",
@@ -67,39 +75,25 @@ def _format_improvement(improvement_pct: float | None) -> str:
 def _render_markdown(
     baseline_name: str,
     candidate_name: str,
-    report: dict[str, object],
+    comparison: ComparisonReport,
 ) -> str:
-    lines: list[str] = []
-    lines.append("# Baseline vs RL Comparison")
-    lines.append("")
-    lines.append(f"- Baseline: `{baseline_name}`")
-    lines.append(f"- Candidate: `{candidate_name}`")
-    lines.append(
-        f"- Improved metrics: {report['improved_metric_count']}/{report['compared_metric_count']}"
+    lines = [
+        "# Baseline vs RL Comparison",
+        "",
+        f"- Baseline: `{baseline_name}`",
+        f"- Candidate: `{candidate_name}`",
+        f"- Improved metrics: {comparison.improved_metric_count}/{comparison.compared_metric_count}",
+        "",
+        "| Metric | Objective | Baseline | Candidate | Delta (RL - Base) | Improvement | Improved |",
+        "|---|---|---:|---:|---:|---:|---|",
+    ]
+    lines.extend(
+        f"| {m.metric} | {m.objective} | {m.baseline:.4f} | {m.candidate:.4f} "
+        f"| {m.delta:+.4f} | {_format_improvement(m.improvement_pct)} "
+        f"| {'n/a' if m.improved is None else str(m.improved)} |"
+        for m in comparison.metrics
     )
     lines.append("")
-    lines.append(
-        "| Metric | Objective | Baseline | Candidate | Delta (RL - Base) | Improvement | Improved |"
-    )
-    lines.append("|---|---|---:|---:|---:|---:|---|")
-    for metric in report["metrics"]:
-        assert isinstance(metric, dict)
-        lines.append(
-            "| {metric} | {objective} | {baseline:.4f} | {candidate:.4f} | {delta:+.4f} | {impr} | {improved} |".format(
-                metric=metric["metric"],
-                objective=metric["objective"],
-                baseline=float(metric["baseline"]),
-                candidate=float(metric["candidate"]),
-                delta=float(metric["delta"]),
-                impr=_format_improvement(
-                    None
-                    if metric["improvement_pct"] is None
-                    else float(metric["improvement_pct"])
-                ),
-                improved="n/a" if metric["improved"] is None else str(bool(metric["improved"])),
-            )
-        )
-    lines.append("")
     return "\n".join(lines)
 
 
@@ -118,27 +112,38 @@ def main() -> None:
         data_splits_config_path=args.data_splits_config,
     )
     if profile_csv_override:
-        cfg.environment.profile_csv = profile_csv_override
+        cfg = with_profile_csv(cfg, profile_csv_override)
 
     baseline_env = MicrogridEnv(cfg)
     rl_env = MicrogridEnv(cfg)
     use_safety = not args.no_safety
 
-    baseline_summary = evaluate_policy(
-        env=baseline_env,
-        policy_fn=baseline_policy_fn(cfg),
-        policy_name="baseline",
-        episodes=args.episodes,
-        seed_start=args.seed_start,
-        use_safety=use_safety,
+    eval_envs = (
+        make_eval_envs(cfg, min(args.n_envs, args.episodes)) if args.n_envs > 1 else None
     )
-    rl_summary = evaluate_policy(
-        env=rl_env,
-        policy_fn=load_rl_policy_fn(args.algo, model_path),
-        policy_name=f"{args.algo}:{model_path.name}",
-        episodes=args.episodes,
-        seed_start=args.seed_start,
-        use_safety=use_safety,
+
+    def _evaluate(env: MicrogridEnv, policy_fn, policy_name: str):
+        if eval_envs is not None:
+            return evaluate_policy_batched(
+                envs=eval_envs,
+                policy_fn=policy_fn,
+                policy_name=policy_name,
+                episodes=args.episodes,
+                seed_start=args.seed_start,
+                use_safety=use_safety,
+            )
+        return evaluate_policy(
+            env=env,
+            policy_fn=policy_fn,
+            policy_name=policy_name,
+            episodes=args.episodes,
+            seed_start=args.seed_start,
+            use_safety=use_safety,
+        )
+
+    baseline_summary = _evaluate(baseline_env, baseline_policy_fn(cfg), "baseline")
+    rl_summary = _evaluate(
+        rl_env, load_rl_policy_fn(args.algo, model_path), f"{args.algo}:{model_path.name}"
     )
 
     comparison = compare_policy_summaries(baseline_summary, rl_summary)
@@ -162,10 +167,7 @@ def main() -> None:
         "comparison": comparison.to_dict(),
     }
 
-    json_out = Path(args.json_out)
-    json_out.parent.mkdir(parents=True, exist_ok=True)
-    with json_out.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
+    json_out = write_json_report(args.json_out, payload)
     print(f"JSON report written to: {json_out}")
 
     markdown_out = Path(args.markdown_out)
@@ -173,7 +175,7 @@ def main() -> None:
     markdown = _render_markdown(
         baseline_name=baseline_summary.policy,
         candidate_name=rl_summary.policy,
-        report=comparison.to_dict(),
+        comparison=comparison,
     )
     with markdown_out.open("w", encoding="utf-8") as handle:
         handle.write(markdown)
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
 from pathlib import Path
 
-from src.config import load_microgrid_config, resolve_profile_csv_override
+from src.config import load_microgrid_config, resolve_profile_csv_override, with_profile_csv
 from src.envs.microgrid_env import MicrogridEnv
+from src.evaluation.async_runner import evaluate_policy_async
+from src.evaluation.reporting import write_json_report
 from src.evaluation.runner import (
     baseline_policy_fn,
     evaluate_policy,
+    evaluate_policy_batched,
     load_rl_policy_fn,
+    make_eval_envs,
     random_policy_fn,
 )
 
@@ -60,6 +64,18 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=1000,
         help="Initial seed for evaluation episodes.",
     )
+    parser.add_argument(
+        "--n-envs",
+        type=int,
+        default=1,
+        help="Environment copies stepped in lockstep per evaluation wave.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for concurrent episode rollout (1 = sequential).",
+    )
     parser.add_argument(
         "--no-safety",
         action="store_true",
@@ -94,7 +110,7 @@ def main() -> None:
         data_splits_config_path=args.data_splits_config,
     )
     if profile_csv_override:
-        cfg.environment.profile_csv = profile_csv_override
+        cfg = with_profile_csv(cfg, profile_csv_override)
     env = MicrogridEnv(cfg)
 
     if args.policy in {"sac", "ddpg"}:
@@ -103,24 +119,50 @@ def main() -> None:
         model_path = Path(args.model_path)
         if not model_path.exists():
             raise SystemExit(f"Model path not found: {model_path}")
-        policy_fn = load_rl_policy_fn(
-            algorithm=args.policy,
-            model_path=model_path,
-            deterministic=True,
-        )
         policy_name = f"{args.policy}:{model_path.name}"
     else:
-        policy_fn = _build_policy_fn(args.policy, env)
+        model_path = None
         policy_name = args.policy
 
-    summary = evaluate_policy(
-        env=env,
-        policy_fn=policy_fn,
-        policy_name=policy_name,
-        episodes=args.episodes,
-        seed_start=args.seed_start,
-        use_safety=not args.no_safety,
-    )
+    def _local_policy_fn():
+        if args.policy in {"sac", "ddpg"}:
+            return load_rl_policy_fn(
+                algorithm=args.policy,
+                model_path=model_path,
+                deterministic=True,
+            )
+        return _build_policy_fn(args.policy, env)
+
+    if args.workers > 1:
+        summary = asyncio.run(
+            evaluate_policy_async(
+                cfg=cfg,
+                policy_spec=(args.policy, args.model_path),
+                policy_name=policy_name,
+                episodes=args.episodes,
+                seed_start=args.seed_start,
+                use_safety=not args.no_safety,
+                max_concurrent=args.workers,
+            )
+        )
+    elif args.n_envs > 1:
+        summary = evaluate_policy_batched(
+            envs=make_eval_envs(cfg, min(args.n_envs, args.episodes)),
+            policy_fn=_local_policy_fn(),
+            policy_name=policy_name,
+            episodes=args.episodes,
+            seed_start=args.seed_start,
+            use_safety=not args.no_safety,
+        )
+    else:
+        summary = evaluate_policy(
+            env=env,
+            policy_fn=_local_policy_fn(),
+            policy_name=policy_name,
+            episodes=args.episodes,
+            seed_start=args.seed_start,
+            use_safety=not args.no_safety,
+        )
 
     print(f"Policy: {summary.policy}")
     print(f"Episodes: {summary.episodes}")
@@ -136,10 +178,7 @@ def main() -> None:
     print(f"Avg safety overrides: {summary.avg_safety_overrides:.2f}")
 
     if args.json_out:
-        out_path = Path(args.json_out)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        with out_path.open("w", encoding="utf-8") as handle:
-            json.dump(summary.to_dict(), handle, indent=2)
+        out_path = write_json_report(args.json_out, summary.to_dict())
         print(f"JSON report written to: {out_path}")
 
 
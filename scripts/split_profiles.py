@@ -4,8 +4,6 @@ import argparse
 import json
 from pathlib import Path
 
-import pandas as pd
-
 from src.config import load_microgrid_config
 from src.data.splitting import split_profile_csv
 from src.data.validation import validate_profiles_csv
@@ -42,7 +40,16 @@ def build_arg_parser() -> argparse.ArgumentParser:
 
 
 def _row_count(path: str) -> int:
-    return int(len(pd.read_csv(path)))
+    """Count data rows (header excluded) by streaming bytes, without parsing."""
+    rows = 0
+    last_chunk = b""
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            rows += chunk.count(b"\n")
+            last_chunk = chunk
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        rows += 1
+    return max(rows - 1, 0)
 
 
 def main() -> None:
@@ -1,26 +1,73 @@
 from __future__ import annotations
 
 import argparse
+import time
 from pathlib import Path
 from typing import Any
 
+import gymnasium as gym
+
 from src.config import (
     load_microgrid_config,
-    resolve_profile_csv_override,
     load_training_config,
+    resolve_profile_csv_override,
+    with_profile_csv,
 )
 from src.envs.microgrid_env import MicrogridEnv
 
 
-def _import_rl_dependencies() -> tuple[dict[str, Any], Any]:
+class EpisodeStatsWrapper(gym.Wrapper):
+    """
+    Minimal Monitor stand-in for steady-state training.
+
+    Tallies episode reward and length and reports them through the standard
+    info["episode"] record that SB3's logger reads, without Monitor's
+    per-step timestamping or CSV writing.
+    """
+
+    def __init__(self, env: gym.Env):
+        super().__init__(env)
+        self._t_start = time.perf_counter()
+        self._episode_reward = 0.0
+        self._episode_length = 0
+
+    def reset(self, **kwargs):
+        self._episode_reward = 0.0
+        self._episode_length = 0
+        return self.env.reset(**kwargs)
+
+    def step(self, action):
+        obs, reward, terminated, truncated, info = self.env.step(action)
+        self._episode_reward += float(reward)
+        self._episode_length += 1
+        if terminated or truncated:
+            info["episode"] = {
+                "r": self._episode_reward,
+                "l": self._episode_length,
+                "t": round(time.perf_counter() - self._t_start, 6),
+            }
+        return obs, reward, terminated, truncated, info
+
+
+def _import_rl_dependencies() -> tuple[dict[str, Any], Any, Any]:
     try:
         from stable_baselines3 import DDPG, SAC
         from stable_baselines3.common.monitor import Monitor
+        from stable_baselines3.common.vec_env import SubprocVecEnv
     except ImportError as exc:
         raise RuntimeError(
             "RL dependencies are missing. Install later with: pip install -r requirements.txt"
         ) from exc
-    return {"sac": SAC, "ddpg": DDPG}, Monitor
+    return {"sac": SAC, "ddpg": DDPG}, Monitor, SubprocVecEnv
+
+
+def _make_env_thunk(microgrid_cfg, seed: int):
+    def _thunk() -> gym.Env:
+        env = EpisodeStatsWrapper(MicrogridEnv(microgrid_cfg))
+        env.reset(seed=seed)
+        return env
+
+    return _thunk
 
 
 def train(
@@ -30,11 +77,11 @@ def train(
     profile_csv_override: str | None = None,
     resume_model_path: str | Path | None = None,
 ) -> Path:
-    algo_map, monitor_cls = _import_rl_dependencies()
+    algo_map, monitor_cls, subproc_vec_env_cls = _import_rl_dependencies()
 
     microgrid_cfg = load_microgrid_config(microgrid_config_path)
     if profile_csv_override:
-        microgrid_cfg.environment.profile_csv = profile_csv_override
+        microgrid_cfg = with_profile_csv(microgrid_cfg, profile_csv_override)
     train_cfg = load_training_config(training_config_path)
 
     algo_name = (override_algo or train_cfg.algorithm).lower()
@@ -42,7 +89,21 @@ def train(
         supported = ", ".join(sorted(algo_map))
         raise ValueError(f"Unsupported algorithm '{algo_name}'. Supported: {supported}")
 
-    env = monitor_cls(MicrogridEnv(microgrid_cfg))
+    if train_cfg.n_envs > 1:
+        # SAC/DDPG are off-policy, so replay collection parallelizes across
+        # subprocess envs while the learner consumes transitions.
+        env = subproc_vec_env_cls(
+            [
+                _make_env_thunk(microgrid_cfg, microgrid_cfg.environment.seed + rank)
+                for rank in range(train_cfg.n_envs)
+            ]
+        )
+    else:
+        base_env = MicrogridEnv(microgrid_cfg)
+        if train_cfg.monitor_csv:
+            env = monitor_cls(base_env, filename=train_cfg.monitor_csv)
+        else:
+            env = EpisodeStatsWrapper(base_env)
 
     model_cls = algo_map[algo_name]
     if resume_model_path:
@@ -57,6 +118,11 @@ def train(
         )
         reset_num_timesteps = False
     else:
+        model_kwargs: dict[str, Any] = {}
+        if train_cfg.n_envs > 1:
+            # Keep the learner's gradient rate matched to the collection rate.
+            model_kwargs["train_freq"] = (1, "step")
+            model_kwargs["gradient_steps"] = train_cfg.n_envs
         model = model_cls(
             policy="MlpPolicy",
             env=env,
@@ -67,6 +133,7 @@ def train(
             tau=train_cfg.tau,
             tensorboard_log=train_cfg.tensorboard_log,
             verbose=1,
+            **model_kwargs,
         )
         reset_num_timesteps = True
 
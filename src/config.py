@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import functools
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same semantics as safe_load.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class EnvironmentConfig:
     episode_horizon: int = 96
     time_step_hours: float = 0.25
@@ -15,7 +19,7 @@ class EnvironmentConfig:
     profile_csv: str | None = "data/raw/profiles.csv"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BatteryConfig:
     capacity_kwh: float = 150.0
     soc_init: float = 0.5
@@ -29,20 +33,20 @@ class BatteryConfig:
     degradation_cost_per_kwh: float = 0.02
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GridConfig:
     max_import_kw: float = 250.0
     max_export_kw: float = 150.0
     sell_price_factor: float = 0.8
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RewardConfig:
     unmet_load_penalty_per_kwh: float = 15.0
     export_curtail_penalty_per_kwh: float = 0.1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MicrogridConfig:
     environment: EnvironmentConfig = field(default_factory=EnvironmentConfig)
     battery: BatteryConfig = field(default_factory=BatteryConfig)
@@ -59,7 +63,7 @@ class MicrogridConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrainingConfig:
     algorithm: str = "sac"
     total_timesteps: int = 200_000
@@ -68,8 +72,10 @@ class TrainingConfig:
     buffer_size: int = 200_000
     gamma: float = 0.99
     tau: float = 0.005
+    n_envs: int = 1
     model_dir: str = "models"
     tensorboard_log: str = "runs"
+    monitor_csv: str | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TrainingConfig":
@@ -77,7 +83,7 @@ class TrainingConfig:
         return cls(**body)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataSplitsConfig:
     train_profile_csv: str = "data/processed/profiles_train.csv"
     val_profile_csv: str = "data/processed/profiles_val.csv"
@@ -101,10 +107,17 @@ class DataSplitsConfig:
         return mapping[split_key]
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(abs_path: str, mtime_ns: int) -> dict[str, Any]:
+    with open(abs_path, "r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=_YAML_LOADER) or {}
+
+
 def _load_yaml(path: str | Path) -> dict[str, Any]:
-    file_path = Path(path)
-    with file_path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+    file_path = Path(path).resolve()
+    # Keyed on (path, mtime) so edited files re-parse while repeated loads
+    # within a process hit the cache.
+    return _load_yaml_cached(str(file_path), file_path.stat().st_mtime_ns)
 
 
 def load_microgrid_config(path: str | Path = "configs/microgrid.yaml") -> MicrogridConfig:
@@ -119,6 +132,11 @@ def load_data_splits_config(path: str | Path = "configs/data_splits.yaml") -> Da
     return DataSplitsConfig.from_dict(_load_yaml(path))
 
 
+def with_profile_csv(cfg: MicrogridConfig, profile_csv: str | None) -> MicrogridConfig:
+    """Return a copy of cfg pointing at another profile CSV (configs are frozen)."""
+    return replace(cfg, environment=replace(cfg.environment, profile_csv=profile_csv))
+
+
 def resolve_profile_csv_override(
     profile_csv: str | None,
     split: str | None,
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover
+    pa = None
+    pacsv = None
+
+
+REQUIRED_COLUMNS = (
+    "renewable_kw",
+    "load_kw",
+    "price_import_per_kwh",
+)
+
+
+def _read_profile_columns(src: Path) -> dict[str, np.ndarray]:
+    """Parse the numeric profile columns, preferring the pyarrow CSV reader."""
+    if pacsv is not None:
+        numeric_columns = (*REQUIRED_COLUMNS, "price_export_per_kwh")
+        table = pacsv.read_csv(
+            src,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.float32() for name in numeric_columns}
+            ),
+        )
+        return {
+            name: table.column(name).to_numpy()
+            for name in numeric_columns
+            if name in table.column_names
+        }
+    frame = pd.read_csv(src)
+    return {
+        name: frame[name].to_numpy(dtype=np.float32)
+        for name in (*REQUIRED_COLUMNS, "price_export_per_kwh")
+        if name in frame.columns
+    }
+
+
+def ensure_npy(csv_path: str | Path) -> Path:
+    """
+    Build (or reuse) a binary ``.npy`` sidecar for a profile CSV.
+
+    The sidecar holds a float32 ``(rows, 4)`` matrix with columns
+    renewable_kw, load_kw, price_import_per_kwh, price_export_per_kwh;
+    the export column is NaN when the CSV does not provide one. It is
+    rebuilt whenever the CSV is newer than the sidecar.
+    """
+    src = Path(csv_path)
+    npy_path = Path(f"{src}.npy")
+    if npy_path.exists() and npy_path.stat().st_mtime_ns >= src.stat().st_mtime_ns:
+        return npy_path
+
+    columns = _read_profile_columns(src)
+    missing = sorted(set(REQUIRED_COLUMNS) - set(columns))
+    if missing:
+        raise ValueError(f"CSV missing required columns: {missing}")
+
+    rows = columns[REQUIRED_COLUMNS[0]].shape[0]
+    matrix = np.full((rows, 4), np.nan, dtype=np.float32)
+    for column_index, column in enumerate(REQUIRED_COLUMNS):
+        matrix[:, column_index] = columns[column]
+    if "price_export_per_kwh" in columns:
+        matrix[:, 3] = columns["price_export_per_kwh"]
+
+    # Write-then-rename so concurrent workers never see a partial file.
+    fd, tmp_name = tempfile.mkstemp(dir=src.parent, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            np.save(handle, matrix)
+        os.replace(tmp_name, npy_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return npy_path
+
+
+def load_profile_matrix(csv_path: str | Path) -> np.ndarray:
+    """
+    Memory-map the profile matrix for a CSV, building the sidecar if needed.
+
+    The returned array is read-only and backed by the OS page cache, so
+    parallel workers share one physical copy instead of each parsing the CSV.
+    """
+    return np.load(ensure_npy(csv_path), mmap_mode="r")
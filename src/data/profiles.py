@@ -1,86 +1,163 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 
+import math
+
 import numpy as np
-import pandas as pd
+
+from src.data.profile_cache import load_profile_matrix
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
 
 
 @dataclass
 class Profiles:
-    renewable_kw: np.ndarray
-    load_kw: np.ndarray
-    price_import_per_kwh: np.ndarray
-    price_export_per_kwh: np.ndarray
+    """
+    Profile series stored as one contiguous (horizon, 4) float32 matrix.
+
+    Columns: renewable_kw, load_kw, price_import_per_kwh,
+    price_export_per_kwh. Per-series attributes are column views created
+    once, so a step's reads at index t land on a single cache line instead
+    of four separate allocations.
+    """
+
+    data: np.ndarray
+
+    def __post_init__(self) -> None:
+        if self.data.dtype != np.float32:
+            raise ValueError(f"Profile matrix must be float32. Got {self.data.dtype}.")
+        self.renewable_kw = self.data[:, 0]
+        self.load_kw = self.data[:, 1]
+        self.price_import_per_kwh = self.data[:, 2]
+        self.price_export_per_kwh = self.data[:, 3]
 
 
 def _resize(series: np.ndarray, horizon: int) -> np.ndarray:
     if series.size == 0:
         raise ValueError("Profile series cannot be empty.")
     if series.size >= horizon:
-        return series[:horizon].astype(np.float32)
-    repeats = int(np.ceil(horizon / series.size))
-    return np.tile(series, repeats)[:horizon].astype(np.float32)
+        # View when the dtype already matches; callers copy on assignment.
+        return series[:horizon].astype(np.float32, copy=False)
+    # Wrap-around gather sized to the target, instead of tiling a full
+    # repeats-times copy and slicing most of it away.
+    return np.take(
+        series.astype(np.float32, copy=False), np.arange(horizon), mode="wrap"
+    )
+
+
+def _synthetic_profiles_py(
+    horizon: int,
+    dt_hours: float,
+    noise: np.ndarray,
+    renewable_kw: np.ndarray,
+    load_kw: np.ndarray,
+    price_import: np.ndarray,
+    price_export: np.ndarray,
+) -> None:
+    two_pi_per_day = 2.0 * math.pi / 24.0
+    for t in range(horizon):
+        hour_of_day = (t * dt_hours) % 24.0
+
+        solar_shape = max(0.0, math.sin((hour_of_day - 6.0) / 12.0 * math.pi))
+        wind_shape = 0.45 + 0.20 * math.sin((hour_of_day + 3.0) * two_pi_per_day)
+        wind_shape = min(max(wind_shape + 0.05 * noise[0, t], 0.0), 1.0)
+        renewable_kw[t] = max(80.0 * solar_shape + 40.0 * wind_shape, 0.0)
+
+        load_base = 110.0 + 18.0 * math.sin((hour_of_day - 17.0) * two_pi_per_day)
+        load_kw[t] = max(load_base + 4.0 * noise[1, t], 60.0)
+
+        evening_peak = 1.0 if 17.0 <= hour_of_day <= 22.0 else 0.0
+        import_price = max(0.10 + 0.08 * evening_peak + 0.004 * noise[2, t], 0.05)
+        price_import[t] = import_price
+        price_export[t] = 0.75 * import_price
+
+
+if njit is not None:
+    _synthetic_profiles = njit(cache=True, fastmath=True)(_synthetic_profiles_py)
+    # Pre-warm so compilation happens at import time, not inside rollouts.
+    _synthetic_profiles(
+        1,
+        0.25,
+        np.zeros((3, 1), dtype=np.float32),
+        *(np.empty(1, dtype=np.float32) for _ in range(4)),
+    )
+else:  # pragma: no cover
+    _synthetic_profiles = _synthetic_profiles_py
 
 
 def build_synthetic_profiles(horizon: int, dt_hours: float, seed: int) -> Profiles:
     rng = np.random.default_rng(seed)
-    time_idx = np.arange(horizon, dtype=np.float32)
-    hour_of_day = (time_idx * dt_hours) % 24.0
-
-    solar_shape = np.maximum(0.0, np.sin((hour_of_day - 6.0) / 12.0 * np.pi))
-    wind_shape = 0.45 + 0.20 * np.sin((hour_of_day + 3.0) * 2.0 * np.pi / 24.0)
-    wind_noise = rng.normal(0.0, 0.05, size=horizon)
-    wind_shape = np.clip(wind_shape + wind_noise, 0.0, 1.0)
-    renewable_kw = np.clip(80.0 * solar_shape + 40.0 * wind_shape, 0.0, None)
-
-    load_base = 110.0 + 18.0 * np.sin((hour_of_day - 17.0) * 2.0 * np.pi / 24.0)
-    load_noise = rng.normal(0.0, 4.0, size=horizon)
-    load_kw = np.clip(load_base + load_noise, 60.0, None)
-
-    evening_peak = ((hour_of_day >= 17.0) & (hour_of_day <= 22.0)).astype(np.float32)
-    price_import = 0.10 + 0.08 * evening_peak + rng.normal(0.0, 0.004, size=horizon)
-    price_import = np.clip(price_import, 0.05, None)
-    price_export = 0.75 * price_import
-
-    return Profiles(
-        renewable_kw=renewable_kw.astype(np.float32),
-        load_kw=load_kw.astype(np.float32),
-        price_import_per_kwh=price_import.astype(np.float32),
-        price_export_per_kwh=price_export.astype(np.float32),
+    # One float32 in-place draw for all three noise vectors; the fused
+    # kernel scales them, so no float64 intermediate is ever allocated.
+    noise = np.empty((3, horizon), dtype=np.float32)
+    rng.standard_normal(out=noise, dtype=np.float32)
+
+    data = np.empty((horizon, 4), dtype=np.float32, order="C")
+    _synthetic_profiles(
+        horizon, float(dt_hours), noise, data[:, 0], data[:, 1], data[:, 2], data[:, 3]
     )
+    return Profiles(data=data)
 
 
 def load_profiles_from_csv(
     csv_path: str | Path, horizon: int, sell_price_factor: float = 0.75
 ) -> Profiles:
-    file_path = Path(csv_path)
-    frame = pd.read_csv(file_path)
-
-    required = {
-        "renewable_kw",
-        "load_kw",
-        "price_import_per_kwh",
-    }
-    missing = sorted(required - set(frame.columns))
-    if missing:
-        raise ValueError(f"CSV missing required columns: {missing}")
-
-    if "price_export_per_kwh" in frame.columns:
-        price_export_series = frame["price_export_per_kwh"].to_numpy(dtype=np.float32)
-    else:
-        price_export_series = (
-            frame["price_import_per_kwh"].to_numpy(dtype=np.float32) * float(sell_price_factor)
-        )
+    # Reads go through the mmap'd .npy sidecar: the CSV is parsed at most
+    # once per edit and parallel workers share one page-cached copy.
+    matrix = load_profile_matrix(csv_path)
+    if matrix.shape[0] == 0:
+        raise ValueError("Profile series cannot be empty.")
+
+    price_export_series = matrix[:, 3]
+    if np.isnan(price_export_series[0]):
+        price_export_series = matrix[:, 2] * np.float32(sell_price_factor)
+
+    data = np.empty((horizon, 4), dtype=np.float32, order="C")
+    data[:, 0] = _resize(matrix[:, 0], horizon)
+    data[:, 1] = _resize(matrix[:, 1], horizon)
+    data[:, 2] = _resize(matrix[:, 2], horizon)
+    data[:, 3] = _resize(price_export_series, horizon)
+    return Profiles(data=data)
+
+
+def _freeze(profiles: Profiles) -> Profiles:
+    # Cached instances are shared across env instances and resets; freeze
+    # the backing matrix and its column views so a stray in-place edit
+    # cannot corrupt other episodes.
+    for series in (
+        profiles.data,
+        profiles.renewable_kw,
+        profiles.load_kw,
+        profiles.price_import_per_kwh,
+        profiles.price_export_per_kwh,
+    ):
+        series.setflags(write=False)
+    return profiles
+
+
+@functools.lru_cache(maxsize=8)
+def _build_synthetic_profiles_cached(
+    horizon: int, dt_hours: float, seed: int
+) -> Profiles:
+    return _freeze(build_synthetic_profiles(horizon, dt_hours, seed))
+
 
-    return Profiles(
-        renewable_kw=_resize(frame["renewable_kw"].to_numpy(dtype=np.float32), horizon),
-        load_kw=_resize(frame["load_kw"].to_numpy(dtype=np.float32), horizon),
-        price_import_per_kwh=_resize(
-            frame["price_import_per_kwh"].to_numpy(dtype=np.float32), horizon
-        ),
-        price_export_per_kwh=_resize(price_export_series, horizon),
+@functools.lru_cache(maxsize=8)
+def _load_profiles_from_csv_cached(
+    abs_path: str, mtime_ns: int, horizon: int, sell_price_factor: float
+) -> Profiles:
+    return _freeze(
+        load_profiles_from_csv(
+            csv_path=abs_path,
+            horizon=horizon,
+            sell_price_factor=sell_price_factor,
+        )
     )
 
 
@@ -92,9 +169,11 @@ def get_profiles(
     sell_price_factor: float = 0.75,
 ) -> Profiles:
     if profile_csv and Path(profile_csv).exists():
-        return load_profiles_from_csv(
-            csv_path=profile_csv,
+        resolved = Path(profile_csv).resolve()
+        return _load_profiles_from_csv_cached(
+            abs_path=str(resolved),
+            mtime_ns=resolved.stat().st_mtime_ns,
             horizon=horizon,
-            sell_price_factor=sell_price_factor,
+            sell_price_factor=float(sell_price_factor),
         )
-    return build_synthetic_profiles(horizon, dt_hours, seed)
+    return _build_synthetic_profiles_cached(horizon, float(dt_hours), int(seed))
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import csv
+import itertools
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from src.data.validation import parse_timestamps
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover
+    pa = None
+    pacsv = None
+
 
 @dataclass
 class SplitResult:
@@ -13,12 +25,12 @@ class SplitResult:
     test: pd.DataFrame
 
 
-def split_profile_frame(
-    frame: pd.DataFrame,
-    train_ratio: float = 0.70,
-    val_ratio: float = 0.15,
-    test_ratio: float = 0.15,
-) -> SplitResult:
+def _split_counts(
+    n_rows: int,
+    train_ratio: float,
+    val_ratio: float,
+    test_ratio: float,
+) -> tuple[int, int, int]:
     for name, value in [
         ("train_ratio", train_ratio),
         ("val_ratio", val_ratio),
@@ -33,17 +45,9 @@ def split_profile_frame(
             f"Split ratios must sum to 1.0. Got {total:.6f} for "
             f"train={train_ratio}, val={val_ratio}, test={test_ratio}."
         )
-    if len(frame) < 3:
+    if n_rows < 3:
         raise ValueError("At least 3 rows are required to create train/val/test splits.")
 
-    if "timestamp" in frame.columns:
-        ts = pd.to_datetime(frame["timestamp"], errors="coerce")
-        if ts.isna().any():
-            raise ValueError("Timestamp column contains invalid values; cannot split chronologically.")
-        if not ts.is_monotonic_increasing:
-            raise ValueError("Timestamp column must be sorted before splitting.")
-
-    n_rows = len(frame)
     raw_counts = [
         int(n_rows * train_ratio),
         int(n_rows * val_ratio),
@@ -66,6 +70,23 @@ def split_profile_frame(
             "Unable to compute non-empty splits. "
             f"Counts train={n_train}, val={n_val}, test={n_test}, total={n_rows}."
         )
+    return n_train, n_val, n_test
+
+
+def split_profile_frame(
+    frame: pd.DataFrame,
+    train_ratio: float = 0.70,
+    val_ratio: float = 0.15,
+    test_ratio: float = 0.15,
+) -> SplitResult:
+    if "timestamp" in frame.columns:
+        ts = parse_timestamps(frame["timestamp"])
+        if ts.isna().any():
+            raise ValueError("Timestamp column contains invalid values; cannot split chronologically.")
+        if not ts.is_monotonic_increasing:
+            raise ValueError("Timestamp column must be sorted before splitting.")
+
+    n_train, n_val, _ = _split_counts(len(frame), train_ratio, val_ratio, test_ratio)
 
     train = frame.iloc[:n_train].reset_index(drop=True)
     val = frame.iloc[n_train : n_train + n_val].reset_index(drop=True)
@@ -73,6 +94,49 @@ def split_profile_frame(
     return SplitResult(train=train, val=val, test=test)
 
 
+def _count_data_rows(path: Path) -> int:
+    rows = 0
+    last_chunk = b""
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            rows += chunk.count(b"\n")
+            last_chunk = chunk
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        rows += 1
+    return max(rows - 1, 0)
+
+
+def _check_timestamps_sorted(input_csv: Path) -> None:
+    with input_csv.open("r", encoding="utf-8", newline="") as handle:
+        header = next(csv.reader(handle), [])
+    if "timestamp" not in header:
+        return
+
+    if pacsv is not None:
+        table = pacsv.read_csv(
+            input_csv,
+            convert_options=pacsv.ConvertOptions(include_columns=["timestamp"]),
+        )
+        column = table.column("timestamp")
+        if pa.types.is_timestamp(column.type):
+            if column.null_count:
+                raise ValueError(
+                    "Timestamp column contains invalid values; cannot split chronologically."
+                )
+            values = column.combine_chunks().to_numpy()
+            if np.any(np.diff(values.view(np.int64)) < 0):
+                raise ValueError("Timestamp column must be sorted before splitting.")
+            return
+        # Arrow could not infer timestamps; fall through so pandas reports
+        # the invalid values.
+
+    ts = parse_timestamps(pd.read_csv(input_csv, usecols=["timestamp"])["timestamp"])
+    if ts.isna().any():
+        raise ValueError("Timestamp column contains invalid values; cannot split chronologically.")
+    if not ts.is_monotonic_increasing:
+        raise ValueError("Timestamp column must be sorted before splitting.")
+
+
 def split_profile_csv(
     input_csv: str | Path,
     output_dir: str | Path,
@@ -80,13 +144,13 @@ def split_profile_csv(
     val_ratio: float = 0.15,
     test_ratio: float = 0.15,
 ) -> dict[str, Path]:
-    frame = pd.read_csv(input_csv)
-    splits = split_profile_frame(
-        frame=frame,
-        train_ratio=train_ratio,
-        val_ratio=val_ratio,
-        test_ratio=test_ratio,
-    )
+    # Rows are sliced chronologically by index, so the values never need to
+    # be parsed: stream raw lines into the three outputs instead of a
+    # pandas read/format round-trip over the whole file.
+    src_path = Path(input_csv)
+    _check_timestamps_sorted(src_path)
+    n_rows = _count_data_rows(src_path)
+    n_train, n_val, _ = _split_counts(n_rows, train_ratio, val_ratio, test_ratio)
 
     out = Path(output_dir)
     out.mkdir(parents=True, exist_ok=True)
@@ -96,7 +160,10 @@ def split_profile_csv(
         "val": out / "profiles_val.csv",
         "test": out / "profiles_test.csv",
     }
-    splits.train.to_csv(paths["train"], index=False)
-    splits.val.to_csv(paths["val"], index=False)
-    splits.test.to_csv(paths["test"], index=False)
+    with src_path.open("rb") as src:
+        header = next(src)
+        for key, count in [("train", n_train), ("val", n_val), ("test", None)]:
+            with paths[key].open("wb") as dst:
+                dst.write(header)
+                dst.writelines(itertools.islice(src, count))
     return paths
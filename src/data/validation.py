@@ -35,9 +35,18 @@ class ValidationReport:
         return len(self.errors) == 0
 
 
-def _count_non_finite(values: pd.Series) -> int:
-    arr = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64)
-    return int(np.isnan(arr).sum() + np.isinf(arr).sum())
+def parse_timestamps(values: pd.Series) -> pd.Series:
+    """
+    Parse a timestamp column, trying the fast ISO8601 path first.
+
+    A format hint lets pandas stay on its C parser; anything it cannot
+    handle falls back to the general (dateutil-backed) parse so mixed or
+    exotic formats keep working.
+    """
+    parsed = pd.to_datetime(values, format="ISO8601", errors="coerce")
+    if parsed.isna().any():
+        parsed = pd.to_datetime(values, errors="coerce")
+    return parsed
 
 
 def validate_profiles_frame(
@@ -70,52 +79,63 @@ def validate_profiles_frame(
             "Column 'price_export_per_kwh' is missing. Export price will be derived from import price."
         )
 
+    # One numeric conversion per column; non-finite and negative checks run
+    # on the same cached float64 array.
+    numeric_arrays = {
+        col: pd.to_numeric(frame[col], errors="coerce").to_numpy(dtype=np.float64)
+        for col in numeric_columns
+    }
+
     for col in numeric_columns:
-        non_finite = _count_non_finite(frame[col])
+        non_finite = int((~np.isfinite(numeric_arrays[col])).sum())
         if non_finite > 0:
             report.errors.append(f"Column '{col}' has {non_finite} non-finite values.")
 
     for col in numeric_columns:
-        negative_count = int((pd.to_numeric(frame[col], errors="coerce") < 0).sum())
+        negative_count = int((numeric_arrays[col] < 0).sum())
         if negative_count > 0:
             report.errors.append(f"Column '{col}' has {negative_count} negative values.")
 
     if "timestamp" in frame.columns:
-        ts = pd.to_datetime(frame["timestamp"], errors="coerce")
+        ts = parse_timestamps(frame["timestamp"])
         invalid_ts = int(ts.isna().sum())
         if invalid_ts > 0:
             report.errors.append(f"Column 'timestamp' has {invalid_ts} invalid datetime values.")
         else:
-            if not ts.is_monotonic_increasing:
+            # Work on the int64 nanosecond view so ordering, duplicate, and
+            # timestep checks are single NumPy passes instead of per-row ops.
+            ts_ns = ts.to_numpy(dtype="datetime64[ns]").view(np.int64)
+            diffs_ns = np.diff(ts_ns)
+
+            if (diffs_ns < 0).any():
                 report.errors.append("Column 'timestamp' is not sorted in ascending order.")
 
-            duplicate_count = int(ts.duplicated().sum())
+            duplicate_count = int((diffs_ns == 0).sum())
             if duplicate_count > 0:
                 report.errors.append(f"Column 'timestamp' has {duplicate_count} duplicate entries.")
 
             report.timestamp_start = str(ts.iloc[0])
             report.timestamp_end = str(ts.iloc[-1])
 
-            if len(ts) > 1:
-                diffs = ts.diff().dropna().dt.total_seconds() / 60.0
-                if len(diffs) > 0:
-                    report.inferred_timestep_minutes = float(diffs.median())
-                    if expected_dt_hours is not None:
-                        expected_minutes = expected_dt_hours * 60.0
-                        if not np.isclose(
-                            report.inferred_timestep_minutes,
-                            expected_minutes,
-                            atol=1.0,
-                        ):
-                            report.warnings.append(
-                                "Inferred timestep "
-                                f"{report.inferred_timestep_minutes:.2f} min does not match "
-                                f"expected {expected_minutes:.2f} min."
-                            )
+            if diffs_ns.size > 0:
+                diffs = diffs_ns / 60e9
+                report.inferred_timestep_minutes = float(np.median(diffs))
+                if expected_dt_hours is not None:
+                    expected_minutes = expected_dt_hours * 60.0
+                    if not np.isclose(
+                        report.inferred_timestep_minutes,
+                        expected_minutes,
+                        atol=1.0,
+                    ):
+                        report.warnings.append(
+                            "Inferred timestep "
+                            f"{report.inferred_timestep_minutes:.2f} min does not match "
+                            f"expected {expected_minutes:.2f} min."
+                        )
     else:
         report.warnings.append("Column 'timestamp' is missing. Time continuity checks were skipped.")
 
-    peak_load = float(pd.to_numeric(frame["load_kw"], errors="coerce").max())
+    peak_load = float(np.nanmax(numeric_arrays["load_kw"]))
     if peak_load > 10_000:
         report.warnings.append(
             f"Peak load appears high ({peak_load:.2f} kW). Verify scaling/units."
@@ -9,6 +9,92 @@ from gymnasium import spaces
 from src.config import MicrogridConfig
 from src.data.profiles import Profiles, get_profiles
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+
+def _soc_rollout_py(
+    cmds: np.ndarray,
+    soc0: float,
+    temp0: float,
+    dt_hours: float,
+    capacity: float,
+    soc_min: float,
+    soc_max: float,
+    charge_efficiency: float,
+    discharge_efficiency: float,
+    max_charge_kw: float,
+    max_discharge_kw: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sequential SOC/thermal recurrence over an episode of battery commands."""
+    horizon = cmds.shape[0]
+    battery_kw = np.empty(horizon, dtype=np.float64)
+    soc = np.empty(horizon, dtype=np.float64)
+    clipped_kwh = np.empty(horizon, dtype=np.float64)
+    temperature_c = np.empty(horizon, dtype=np.float64)
+
+    soc_now = soc0
+    temp_now = temp0
+    for t in range(horizon):
+        cmd_kw = cmds[t]
+        if cmd_kw >= 0.0:
+            energy_available = max(soc_now - soc_min, 0.0) * capacity
+            discharge_limit_soc = (energy_available * discharge_efficiency) / dt_hours
+            actual_kw = min(cmd_kw, max_discharge_kw, discharge_limit_soc)
+            delta_soc = -(actual_kw * dt_hours) / (capacity * discharge_efficiency)
+        else:
+            room_available = max(soc_max - soc_now, 0.0) * capacity
+            charge_limit_soc = room_available / (dt_hours * charge_efficiency)
+            actual_kw = -min(abs(cmd_kw), max_charge_kw, charge_limit_soc)
+            delta_soc = (-actual_kw * dt_hours * charge_efficiency) / capacity
+
+        soc_now = min(max(soc_now + delta_soc, soc_min), soc_max)
+        temp_now = min(max(temp_now + 0.01 * abs(actual_kw) - 0.02, 15.0), 60.0)
+
+        battery_kw[t] = actual_kw
+        soc[t] = soc_now
+        clipped_kwh[t] = abs(cmd_kw - actual_kw) * dt_hours
+        temperature_c[t] = temp_now
+
+    return battery_kw, soc, clipped_kwh, temperature_c
+
+
+if njit is not None:
+    _soc_rollout = njit(cache=True, fastmath=True)(_soc_rollout_py)
+    # Pre-warm so compilation happens at import time, not inside rollouts.
+    _soc_rollout(
+        np.zeros(1, dtype=np.float64), 0.5, 30.0, 0.25, 150.0, 0.1, 0.9, 0.95, 0.95, 75.0, 75.0
+    )
+else:  # pragma: no cover
+    _soc_rollout = _soc_rollout_py
+
+
+# Observation bounds are config-independent; share one frozen pair of
+# arrays across env instances instead of rebuilding them per construction.
+_OBS_LOW = np.array([0.0, 0.0, 0.0, 0.0, 0.0, -20.0, 0.0, 0.0], dtype=np.float32)
+_OBS_HIGH = np.array([1e4, 1e4, 1e4, 1e4, 1.0, 100.0, 10.0, 10.0], dtype=np.float32)
+_OBS_LOW.setflags(write=False)
+_OBS_HIGH.setflags(write=False)
+
+
+_INFO_KEYS = (
+    "timestep",
+    "renewable_kw",
+    "load_kw",
+    "battery_kw",
+    "grid_kw",
+    "soc",
+    "temperature_c",
+    "unmet_load_kwh",
+    "curtailed_kwh",
+    "cost_grid",
+    "cost_degradation",
+    "cost_penalty",
+    "reward",
+)
+
 
 class MicrogridEnv(gym.Env):
     """
@@ -20,6 +106,19 @@ class MicrogridEnv(gym.Env):
 
     Observation:
     - [renew_now, renew_forecast, load_now, load_forecast, soc, temp_c, price_now, price_forecast]
+
+    Per-step metrics are recorded into preallocated struct-of-arrays
+    buffers readable via ``episode_info()``. Callers that aggregate
+    post-episode can set ``return_step_info = False`` to skip the per-step
+    info dict allocation.
+
+    Info-key contract: when ``return_step_info`` is enabled, the step info
+    dict always contains ``timestep`` (int) plus ``renewable_kw``,
+    ``load_kw``, ``battery_kw``, ``grid_kw``, ``soc``, ``temperature_c``,
+    ``unmet_load_kwh``, ``curtailed_kwh``, ``import_kwh``, ``export_kwh``,
+    ``batt_throughput_kwh``, ``cost_grid``, ``cost_degradation``, and
+    ``cost_penalty`` as plain Python floats — consumers may subscript
+    directly without ``.get`` fallbacks or ``float()`` coercion.
     """
 
     metadata = {"render_modes": ["human"]}
@@ -47,12 +146,19 @@ class MicrogridEnv(gym.Env):
         )
 
         self.observation_space = spaces.Box(
-            low=np.array([0.0, 0.0, 0.0, 0.0, 0.0, -20.0, 0.0, 0.0], dtype=np.float32),
-            high=np.array([1e4, 1e4, 1e4, 1e4, 1.0, 100.0, 10.0, 10.0], dtype=np.float32),
+            low=_OBS_LOW,
+            high=_OBS_HIGH,
             dtype=np.float32,
         )
 
         self._profiles: Profiles | None = None
+        self._obs_template: np.ndarray | None = None
+        self._obs_buf = np.empty(8, dtype=np.float32)
+        self._info_buf = {
+            key: np.empty(self.horizon, dtype=np.float64) for key in _INFO_KEYS
+        }
+        self.return_step_info = True
+        self._last_reset_seed: int | None = None
         self._t = 0
         self._soc = float(self.cfg.battery.soc_init)
         self._temperature_c = float(self.cfg.battery.temperature_c)
@@ -67,27 +173,38 @@ class MicrogridEnv(gym.Env):
             seed=use_seed,
             sell_price_factor=self.cfg.grid.sell_price_factor,
         )
+        self._build_obs_template()
+
+    def _build_obs_template(self) -> None:
+        # Static observation features for the whole episode, computed once per
+        # profile load; _get_obs only fills in the SOC/temperature slots.
+        assert self._profiles is not None
+        horizon = self.horizon
+        template = np.empty((horizon, 8), dtype=np.float32)
+        for column, series in (
+            (0, self._profiles.renewable_kw),
+            (2, self._profiles.load_kw),
+            (6, self._profiles.price_import_per_kwh),
+        ):
+            template[:, column] = series[:horizon]
+            template[:-1, column + 1] = series[1:horizon]
+            template[-1, column + 1] = series[horizon - 1]
+        self._obs_template = template
 
     def _value_at(self, series: np.ndarray, index: int) -> float:
-        safe_idx = int(np.clip(index, 0, self.horizon - 1))
+        # Plain branch arithmetic; np.clip on a scalar costs ~1 us per call.
+        safe_idx = index if index < self.horizon else self.horizon - 1
         return float(series[safe_idx])
 
     def _get_obs(self) -> np.ndarray:
-        assert self._profiles is not None
-        idx = self._t
-        obs = np.array(
-            [
-                self._value_at(self._profiles.renewable_kw, idx),
-                self._value_at(self._profiles.renewable_kw, idx + 1),
-                self._value_at(self._profiles.load_kw, idx),
-                self._value_at(self._profiles.load_kw, idx + 1),
-                self._soc,
-                self._temperature_c,
-                self._value_at(self._profiles.price_import_per_kwh, idx),
-                self._value_at(self._profiles.price_import_per_kwh, idx + 1),
-            ],
-            dtype=np.float32,
-        )
+        # The buffer is reused across steps; callers that retain an
+        # observation past the next step must copy it.
+        assert self._obs_template is not None
+        idx = self._t if self._t < self.horizon else self.horizon - 1
+        obs = self._obs_buf
+        obs[:] = self._obs_template[idx]
+        obs[4] = self._soc
+        obs[5] = self._temperature_c
         return obs
 
     def _apply_battery_constraints(self, cmd_kw: float) -> tuple[float, float]:
@@ -105,14 +222,22 @@ class MicrogridEnv(gym.Env):
             actual_kw = -min(abs(cmd_kw), b.max_charge_kw, charge_limit_soc)
             delta_soc = (-actual_kw * self.dt_hours * b.charge_efficiency) / capacity
 
-        self._soc = float(np.clip(self._soc + delta_soc, b.soc_min, b.soc_max))
+        soc_next = self._soc + delta_soc
+        self._soc = min(max(soc_next, b.soc_min), b.soc_max)
         clipped_energy_kwh = abs(cmd_kw - actual_kw) * self.dt_hours
         return float(actual_kw), float(clipped_energy_kwh)
 
     def reset(
         self, *, seed: int | None = None, options: dict[str, Any] | None = None
     ) -> tuple[np.ndarray, dict[str, Any]]:
-        super().reset(seed=seed)
+        # Re-seeding builds a fresh SeedSequence + PCG64 pair; skip it when
+        # the seed is unchanged. The dynamics are deterministic and never
+        # draw from np_random, so the existing generator is equivalent.
+        if seed is not None and seed == self._last_reset_seed:
+            super().reset()
+        else:
+            super().reset(seed=seed)
+            self._last_reset_seed = seed
         self._reload_profiles(seed)
         self._t = 0
 
@@ -120,7 +245,7 @@ class MicrogridEnv(gym.Env):
         if options and "soc_init" in options:
             start_soc = float(options["soc_init"])
 
-        self._soc = float(np.clip(start_soc, self.cfg.battery.soc_min, self.cfg.battery.soc_max))
+        self._soc = min(max(float(start_soc), self.cfg.battery.soc_min), self.cfg.battery.soc_max)
         self._temperature_c = float(self.cfg.battery.temperature_c)
         self._last_info = {}
         return self._get_obs(), {}
@@ -138,18 +263,19 @@ class MicrogridEnv(gym.Env):
             )
 
         idx = self._t
-        renewable_kw = self._value_at(self._profiles.renewable_kw, idx)
-        load_kw = self._value_at(self._profiles.load_kw, idx)
-        price_import = self._value_at(self._profiles.price_import_per_kwh, idx)
-        price_export = self._value_at(self._profiles.price_export_per_kwh, idx)
+        # idx is always < horizon inside step; index the series directly.
+        renewable_kw = float(self._profiles.renewable_kw[idx])
+        load_kw = float(self._profiles.load_kw[idx])
+        price_import = float(self._profiles.price_import_per_kwh[idx])
+        price_export = float(self._profiles.price_export_per_kwh[idx])
 
         battery_cmd_kw = float(action[0])
         battery_kw, clipped_energy_kwh = self._apply_battery_constraints(battery_cmd_kw)
 
         # Grid follows the residual demand after renewable and battery dispatch.
         balance_gap_kw = load_kw - renewable_kw - battery_kw
-        grid_cmd_kw = float(
-            np.clip(balance_gap_kw, -self.cfg.grid.max_export_kw, self.cfg.grid.max_import_kw)
+        grid_cmd_kw = min(
+            max(balance_gap_kw, -self.cfg.grid.max_export_kw), self.cfg.grid.max_import_kw
         )
 
         # Net positive means oversupply, net negative means deficit.
@@ -157,12 +283,15 @@ class MicrogridEnv(gym.Env):
         unmet_load_kwh = max(0.0, -net_balance_kw) * self.dt_hours
         curtailed_kwh = max(0.0, net_balance_kw) * self.dt_hours
 
-        import_cost = max(0.0, grid_cmd_kw) * price_import * self.dt_hours
-        export_revenue = max(0.0, -grid_cmd_kw) * price_export * self.dt_hours
-        grid_cost = import_cost - export_revenue
+        # Energy terms feed both the cost math and the info dict, so they
+        # are computed once here rather than re-derived by consumers.
+        import_kwh = max(0.0, grid_cmd_kw) * self.dt_hours
+        export_kwh = max(0.0, -grid_cmd_kw) * self.dt_hours
+        batt_throughput_kwh = abs(battery_kw) * self.dt_hours
+        grid_cost = import_kwh * price_import - export_kwh * price_export
 
         degradation_cost = (
-            abs(battery_kw) * self.dt_hours * self.cfg.battery.degradation_cost_per_kwh
+            batt_throughput_kwh * self.cfg.battery.degradation_cost_per_kwh
         )
         penalty_cost = (
             unmet_load_kwh * self.cfg.reward.unmet_load_penalty_per_kwh
@@ -172,31 +301,144 @@ class MicrogridEnv(gym.Env):
         reward = -(grid_cost + degradation_cost + penalty_cost)
 
         # Simple thermal proxy for future health-based control.
-        self._temperature_c = float(
-            np.clip(self._temperature_c + 0.01 * abs(battery_kw) - 0.02, 15.0, 60.0)
+        self._temperature_c = min(
+            max(self._temperature_c + 0.01 * abs(battery_kw) - 0.02, 15.0), 60.0
         )
 
         self._t += 1
         terminated = self._t >= self.horizon
         truncated = False
 
-        info = {
-            "timestep": idx,
+        buf = self._info_buf
+        buf["timestep"][idx] = idx
+        buf["renewable_kw"][idx] = renewable_kw
+        buf["load_kw"][idx] = load_kw
+        buf["battery_kw"][idx] = battery_kw
+        buf["grid_kw"][idx] = grid_cmd_kw
+        buf["soc"][idx] = self._soc
+        buf["temperature_c"][idx] = self._temperature_c
+        buf["unmet_load_kwh"][idx] = unmet_load_kwh
+        buf["curtailed_kwh"][idx] = curtailed_kwh
+        buf["cost_grid"][idx] = grid_cost
+        buf["cost_degradation"][idx] = degradation_cost
+        buf["cost_penalty"][idx] = penalty_cost
+        buf["reward"][idx] = reward
+
+        if self.return_step_info:
+            info = {
+                "timestep": idx,
+                "renewable_kw": renewable_kw,
+                "load_kw": load_kw,
+                "battery_kw": battery_kw,
+                "grid_kw": grid_cmd_kw,
+                "soc": self._soc,
+                "temperature_c": self._temperature_c,
+                "unmet_load_kwh": unmet_load_kwh,
+                "curtailed_kwh": curtailed_kwh,
+                "import_kwh": import_kwh,
+                "export_kwh": export_kwh,
+                "batt_throughput_kwh": batt_throughput_kwh,
+                "cost_grid": grid_cost,
+                "cost_degradation": degradation_cost,
+                "cost_penalty": penalty_cost,
+            }
+            self._last_info = info
+        else:
+            info = {}
+
+        return self._get_obs(), float(reward), terminated, truncated, info
+
+    def episode_info(self) -> dict[str, np.ndarray]:
+        """Per-step metric arrays for the steps taken so far this episode."""
+        return {key: self._info_buf[key][: self._t] for key in _INFO_KEYS}
+
+    def rollout(self, battery_cmds: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Execute a full episode of battery commands in one call.
+
+        Equivalent to stepping the freshly reset environment ``horizon``
+        times with the given commands, but only the sequential SOC/thermal
+        recurrence runs as a Python loop; the balance, cost, and reward
+        arithmetic is evaluated as whole-horizon array expressions. Leaves
+        the environment in its terminal state and returns per-step arrays
+        keyed like the ``step`` info dict, plus ``"reward"``.
+        """
+        assert self._profiles is not None
+        if self._t != 0:
+            raise ValueError("rollout() requires a freshly reset environment.")
+        cmds = np.asarray(battery_cmds, dtype=np.float64).reshape(-1)
+        if cmds.size != self.horizon:
+            raise ValueError(
+                f"Expected {self.horizon} battery commands, got {cmds.size}."
+            )
+
+        horizon = self.horizon
+        b = self.cfg.battery
+        battery_kw, soc, clipped_kwh, temperature_c = _soc_rollout(
+            cmds,
+            self._soc,
+            self._temperature_c,
+            self.dt_hours,
+            max(float(b.capacity_kwh), 1e-6),
+            float(b.soc_min),
+            float(b.soc_max),
+            float(b.charge_efficiency),
+            float(b.discharge_efficiency),
+            float(b.max_charge_kw),
+            float(b.max_discharge_kw),
+        )
+        self._soc = float(soc[-1])
+        self._temperature_c = float(temperature_c[-1])
+
+        renewable_kw = self._profiles.renewable_kw[:horizon].astype(np.float64)
+        load_kw = self._profiles.load_kw[:horizon].astype(np.float64)
+        price_import = self._profiles.price_import_per_kwh[:horizon].astype(np.float64)
+        price_export = self._profiles.price_export_per_kwh[:horizon].astype(np.float64)
+
+        balance_gap_kw = load_kw - renewable_kw - battery_kw
+        grid_kw = np.clip(
+            balance_gap_kw, -self.cfg.grid.max_export_kw, self.cfg.grid.max_import_kw
+        )
+
+        net_balance_kw = renewable_kw + battery_kw + grid_kw - load_kw
+        unmet_load_kwh = np.maximum(0.0, -net_balance_kw) * self.dt_hours
+        curtailed_kwh = np.maximum(0.0, net_balance_kw) * self.dt_hours
+
+        import_cost = np.maximum(0.0, grid_kw) * price_import * self.dt_hours
+        export_revenue = np.maximum(0.0, -grid_kw) * price_export * self.dt_hours
+        cost_grid = import_cost - export_revenue
+
+        cost_degradation = (
+            np.abs(battery_kw) * self.dt_hours * self.cfg.battery.degradation_cost_per_kwh
+        )
+        cost_penalty = (
+            unmet_load_kwh * self.cfg.reward.unmet_load_penalty_per_kwh
+            + curtailed_kwh * self.cfg.reward.export_curtail_penalty_per_kwh
+            + clipped_kwh * self.cfg.reward.unmet_load_penalty_per_kwh * 0.25
+        )
+        reward = -(cost_grid + cost_degradation + cost_penalty)
+
+        self._t = horizon
+        self._last_info = {}
+
+        result = {
+            "timestep": np.arange(horizon),
             "renewable_kw": renewable_kw,
             "load_kw": load_kw,
             "battery_kw": battery_kw,
-            "grid_kw": grid_cmd_kw,
-            "soc": self._soc,
-            "temperature_c": self._temperature_c,
+            "grid_kw": grid_kw,
+            "soc": soc,
+            "temperature_c": temperature_c,
             "unmet_load_kwh": unmet_load_kwh,
             "curtailed_kwh": curtailed_kwh,
-            "cost_grid": grid_cost,
-            "cost_degradation": degradation_cost,
-            "cost_penalty": penalty_cost,
+            "cost_grid": cost_grid,
+            "cost_degradation": cost_degradation,
+            "cost_penalty": cost_penalty,
+            "reward": reward,
         }
-        self._last_info = info
-
-        return self._get_obs(), float(reward), terminated, truncated, info
+        for key in _INFO_KEYS:
+            self._info_buf[key][:] = result[key]
+        return result
 
     def render(self) -> None:
         if not self._last_info:
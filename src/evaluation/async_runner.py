@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.config import MicrogridConfig
+from src.envs.microgrid_env import MicrogridEnv
+from src.evaluation.runner import (
+    EpisodeMetrics,
+    EvaluationSummary,
+    _summarize,
+    baseline_policy_fn,
+    load_rl_policy_fn,
+    random_policy_fn,
+    run_episode,
+)
+
+
+# (policy, model_path): ("baseline", None), ("random", None), ("sac", "models/x.zip"), ...
+PolicySpec = tuple[str, str | None]
+
+
+def build_policy_fn_from_spec(spec: PolicySpec, env: MicrogridEnv):
+    policy, model_path = spec
+    if policy == "baseline":
+        return baseline_policy_fn(env.cfg)
+    if policy == "random":
+        return random_policy_fn(env)
+    if policy in {"sac", "ddpg"}:
+        if not model_path:
+            raise ValueError(f"Policy '{policy}' requires a model path.")
+        return load_rl_policy_fn(algorithm=policy, model_path=Path(model_path))
+    raise ValueError(f"Unknown policy type: {policy}")
+
+
+# Worker-process state built once by the pool initializer, so tasks carry
+# only (episode_index, seed) instead of re-pickling the config per episode.
+_WORKER_ENV: MicrogridEnv | None = None
+_WORKER_POLICY_FN = None
+
+
+def _init_episode_worker(cfg_bytes: bytes, spec: PolicySpec) -> None:
+    global _WORKER_ENV, _WORKER_POLICY_FN
+    # Keep workers from oversubscribing cores; each one is a single rollout.
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+    cfg: MicrogridConfig = pickle.loads(cfg_bytes)
+    _WORKER_ENV = MicrogridEnv(cfg)
+    _WORKER_POLICY_FN = build_policy_fn_from_spec(spec, _WORKER_ENV)
+
+
+def _run_episode_worker(
+    episode_index: int,
+    seed: int,
+    use_safety: bool,
+) -> EpisodeMetrics:
+    assert _WORKER_ENV is not None and _WORKER_POLICY_FN is not None
+    return run_episode(
+        env=_WORKER_ENV,
+        policy_fn=_WORKER_POLICY_FN,
+        episode_index=episode_index,
+        seed=seed,
+        use_safety=use_safety,
+    )
+
+
+async def evaluate_policy_async(
+    cfg: MicrogridConfig,
+    policy_spec: PolicySpec,
+    policy_name: str,
+    episodes: int = 10,
+    seed_start: int = 0,
+    use_safety: bool = True,
+    max_concurrent: int | None = None,
+) -> EvaluationSummary:
+    """
+    Evaluate a policy by running independent episodes across worker processes.
+
+    The policy is described by a picklable ``(policy, model_path)`` spec so
+    each worker rebuilds its own environment and policy; live envs and SB3
+    models never cross the process boundary. Seeding follows the same
+    ``seed_start + episode`` scheme as ``evaluate_policy``, so per-episode
+    metrics match the sequential runner.
+    """
+    if episodes <= 0:
+        raise ValueError("episodes must be greater than 0.")
+
+    workers = max_concurrent or min(episodes, os.cpu_count() or 1)
+    cfg_bytes = pickle.dumps(cfg)
+    loop = asyncio.get_running_loop()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_episode_worker,
+        initargs=(cfg_bytes, policy_spec),
+    ) as pool:
+        tasks = [
+            loop.run_in_executor(
+                pool,
+                _run_episode_worker,
+                episode,
+                seed_start + episode,
+                use_safety,
+            )
+            for episode in range(episodes)
+        ]
+        details = list(await asyncio.gather(*tasks))
+
+    return _summarize(policy_name, episodes, details)
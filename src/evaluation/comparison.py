@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import operator
+from dataclasses import dataclass
+
+import numpy as np
 
 from src.evaluation.runner import EvaluationSummary
 
@@ -26,9 +29,16 @@ class ComparisonReport:
     compared_metric_count: int
 
     def to_dict(self) -> dict[str, object]:
-        data = asdict(self)
-        data["metrics"] = [asdict(metric) for metric in self.metrics]
-        return data
+        # Metric fields are plain scalars, so a shallow __dict__ copy is
+        # enough; asdict would deepcopy the whole report recursively.
+        return {
+            "baseline_policy": self.baseline_policy,
+            "candidate_policy": self.candidate_policy,
+            "episodes": self.episodes,
+            "metrics": [dict(metric.__dict__) for metric in self.metrics],
+            "improved_metric_count": self.improved_metric_count,
+            "compared_metric_count": self.compared_metric_count,
+        }
 
 
 def _compute_improvement(
@@ -54,30 +64,46 @@ def _compute_improvement(
     raise ValueError(f"Unsupported objective '{objective}'.")
 
 
+_METRIC_SPECS = (
+    ("avg_reward", "higher"),
+    ("avg_grid_cost", "lower"),
+    ("avg_degradation_cost", "lower"),
+    ("avg_penalty_cost", "lower"),
+    ("avg_unmet_load_kwh", "lower"),
+    ("avg_curtailed_kwh", "lower"),
+    ("avg_import_kwh", "lower"),
+    ("avg_export_kwh", "neutral"),
+    ("avg_battery_throughput_kwh", "lower"),
+    ("avg_safety_overrides", "lower"),
+)
+
+# One attrgetter call fetches all metric values as a tuple.
+_METRIC_GETTER = operator.attrgetter(*(attr for attr, _ in _METRIC_SPECS))
+
+# +1 when higher is better, -1 when lower is better, 0 for neutral metrics.
+_METRIC_SIGNS = np.array(
+    [
+        1.0 if objective == "higher" else -1.0 if objective == "lower" else 0.0
+        for _, objective in _METRIC_SPECS
+    ],
+    dtype=np.float64,
+)
+
+
 def compare_policy_summaries(
     baseline: EvaluationSummary,
     candidate: EvaluationSummary,
 ) -> ComparisonReport:
-    specs = [
-        ("avg_reward", "higher"),
-        ("avg_grid_cost", "lower"),
-        ("avg_degradation_cost", "lower"),
-        ("avg_penalty_cost", "lower"),
-        ("avg_unmet_load_kwh", "lower"),
-        ("avg_curtailed_kwh", "lower"),
-        ("avg_import_kwh", "lower"),
-        ("avg_export_kwh", "neutral"),
-        ("avg_battery_throughput_kwh", "lower"),
-        ("avg_safety_overrides", "lower"),
-    ]
+    baseline_values = _METRIC_GETTER(baseline)
+    candidate_values = _METRIC_GETTER(candidate)
 
     metrics: list[MetricComparison] = []
     improved_metric_count = 0
     compared_metric_count = 0
 
-    for attr, objective in specs:
-        b = float(getattr(baseline, attr))
-        c = float(getattr(candidate, attr))
+    for (attr, objective), b, c in zip(_METRIC_SPECS, baseline_values, candidate_values):
+        b = float(b)
+        c = float(c)
         delta = c - b
         improved, improvement_pct = _compute_improvement(b, c, objective)
         if improved is not None:
@@ -105,3 +131,35 @@ def compare_policy_summaries(
         compared_metric_count=compared_metric_count,
     )
 
+
+def compare_many(policies: list[EvaluationSummary]) -> dict[str, np.ndarray]:
+    """
+    Pairwise comparison of N summaries via one (N, N, metrics) computation.
+
+    Returns arrays keyed "metric_names", "values" (N, M), "delta"
+    (candidate minus baseline, indexed [baseline, candidate, metric]),
+    "improved" (bool, False on neutral metrics), and "improvement_pct"
+    (NaN where the baseline is ~0 or the metric is neutral).
+    """
+    if not policies:
+        raise ValueError("At least one summary is required.")
+
+    values = np.array([_METRIC_GETTER(p) for p in policies], dtype=np.float64)
+    delta = values[None, :, :] - values[:, None, :]
+    improved = (delta * _METRIC_SIGNS) > 0.0
+
+    baseline_abs = np.abs(values[:, None, :])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        improvement_pct = np.where(
+            (baseline_abs > 1e-12) & (_METRIC_SIGNS != 0.0),
+            delta * _METRIC_SIGNS / baseline_abs * 100.0,
+            np.nan,
+        )
+
+    return {
+        "metric_names": np.array([attr for attr, _ in _METRIC_SPECS]),
+        "values": values,
+        "delta": delta,
+        "improved": improved,
+        "improvement_pct": improvement_pct,
+    }
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def write_json_report(path: str | Path, payload: dict[str, object]) -> Path:
+    """
+    Write an indented JSON report, serializing with orjson when installed.
+
+    orjson formats floats in C, which matters for reports carrying
+    per-episode metric lists; the stdlib writer is the fallback.
+    """
+    out_path = Path(path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        out_path.write_bytes(
+            orjson.dumps(
+                payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            )
+        )
+        return out_path
+    with out_path.open("w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2)
+    return out_path
@@ -3,11 +3,31 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 try:
-    from pymodbus.client import ModbusTcpClient
+    from pymodbus.client import AsyncModbusTcpClient, ModbusTcpClient
 except ImportError:  # pragma: no cover
+    AsyncModbusTcpClient = None
     ModbusTcpClient = None
 
 
+_INT16_MIN = -32768
+_INT16_MAX = 32767
+
+
+def _to_register_value(kw: float) -> int:
+    """
+    Encode a kW setpoint as a 16-bit register value.
+
+    Raises instead of letting an out-of-range command truncate silently on
+    the wire; negative setpoints are sent as two's complement.
+    """
+    value = int(round(kw))
+    if not _INT16_MIN <= value <= _INT16_MAX:
+        raise ValueError(
+            f"Setpoint {kw:.1f} kW does not fit a signed 16-bit register."
+        )
+    return value & 0xFFFF
+
+
 @dataclass
 class ModbusConfig:
     host: str = "127.0.0.1"
@@ -20,11 +40,22 @@ class ModbusConfig:
 class ModbusDispatcher:
     """
     Minimal Modbus adapter to send EMS setpoints to converter/PLC registers.
+
+    A control loop running under asyncio should prefer ``connect_async`` /
+    ``dispatch_async``: the write can be launched at decision time and
+    awaited at the next step boundary, hiding the network round trip behind
+    the next policy inference instead of blocking on it.
     """
 
     def __init__(self, config: ModbusConfig):
         self.config = config
         self.client = None
+        self.async_client = None
+        # Adjacent registers let both setpoints travel in one write_registers
+        # round trip instead of two.
+        self._contiguous_setpoints = (
+            config.grid_setpoint_register == config.battery_setpoint_register + 1
+        )
 
     def connect(self) -> None:
         if ModbusTcpClient is None:
@@ -37,14 +68,56 @@ class ModbusDispatcher:
     def dispatch(self, battery_kw: float, grid_kw: float) -> None:
         if self.client is None:
             raise RuntimeError("Modbus client is not connected.")
+        battery_value = _to_register_value(battery_kw)
+        grid_value = _to_register_value(grid_kw)
+        if self._contiguous_setpoints:
+            self.client.write_registers(
+                address=self.config.battery_setpoint_register,
+                values=[battery_value, grid_value],
+                slave=self.config.unit_id,
+            )
+            return
         self.client.write_register(
             address=self.config.battery_setpoint_register,
-            value=int(round(battery_kw)),
+            value=battery_value,
             slave=self.config.unit_id,
         )
         self.client.write_register(
             address=self.config.grid_setpoint_register,
-            value=int(round(grid_kw)),
+            value=grid_value,
+            slave=self.config.unit_id,
+        )
+
+    async def connect_async(self) -> None:
+        if AsyncModbusTcpClient is None:
+            raise RuntimeError(
+                "pymodbus is not installed. Install dependencies before Modbus integration."
+            )
+        self.async_client = AsyncModbusTcpClient(
+            host=self.config.host, port=self.config.port
+        )
+        await self.async_client.connect()
+
+    async def dispatch_async(self, battery_kw: float, grid_kw: float) -> None:
+        if self.async_client is None:
+            raise RuntimeError("Async Modbus client is not connected.")
+        battery_value = _to_register_value(battery_kw)
+        grid_value = _to_register_value(grid_kw)
+        if self._contiguous_setpoints:
+            await self.async_client.write_registers(
+                address=self.config.battery_setpoint_register,
+                values=[battery_value, grid_value],
+                slave=self.config.unit_id,
+            )
+            return
+        await self.async_client.write_register(
+            address=self.config.battery_setpoint_register,
+            value=battery_value,
+            slave=self.config.unit_id,
+        )
+        await self.async_client.write_register(
+            address=self.config.grid_setpoint_register,
+            value=grid_value,
             slave=self.config.unit_id,
         )
 
@@ -52,4 +125,7 @@ class ModbusDispatcher:
         if self.client is not None:
             self.client.close()
             self.client = None
+        if self.async_client is not None:
+            self.async_client.close()
+            self.async_client = None
 
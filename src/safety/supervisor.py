@@ -17,46 +17,85 @@ class SafetyDecision:
 class SafetySupervisor:
     """
     Hard safety layer that clips and blocks unsafe actions before dispatch.
+
+    Limits and guard-rail thresholds are extracted to plain floats at
+    construction, so the per-step apply path is scalar compares with no
+    config attribute chasing; reason strings are only assembled when an
+    override actually happened.
     """
 
+    __slots__ = (
+        "cfg",
+        "_batt_low",
+        "_batt_high",
+        "_grid_low",
+        "_grid_high",
+        "_soc_low",
+        "_soc_high",
+        "_temp_limit_c",
+        "_scratch",
+    )
+
     def __init__(self, config: MicrogridConfig):
         self.cfg = config
+        b = config.battery
+        g = config.grid
+        self._batt_low = -float(b.max_charge_kw)
+        self._batt_high = float(b.max_discharge_kw)
+        self._grid_low = -float(g.max_export_kw)
+        self._grid_high = float(g.max_import_kw)
+        self._soc_low = float(b.soc_min) + 0.01
+        self._soc_high = float(b.soc_max) - 0.01
+        self._temp_limit_c = 48.0
+        self._scratch = np.empty(2, dtype=np.float32)
 
     def apply(self, action: np.ndarray, observation: np.ndarray) -> SafetyDecision:
-        safe = np.asarray(action, dtype=np.float32).copy()
-        original = safe.copy()
-        reasons: list[str] = []
-
-        if safe.size not in (1, 2):
+        n = np.size(action)
+        if n not in (1, 2):
             raise ValueError(
                 "Expected action shape (1,) -> [battery_kw]. "
                 "Legacy (2,) -> [battery_kw, grid_kw] is also supported."
             )
+        # The decision's action is a view into supervisor-owned scratch
+        # memory, valid until the next apply call; per-step callers hand it
+        # straight to env.step, so no per-call allocation is needed.
+        safe = self._scratch[:n]
+        safe[:] = np.reshape(action, -1)
         if observation.size < 6:
             raise ValueError("Observation must include SoC and battery temperature.")
 
         soc = float(observation[4])
         temp_c = float(observation[5])
-        b = self.cfg.battery
-        g = self.cfg.grid
 
-        safe[0] = float(np.clip(safe[0], -b.max_charge_kw, b.max_discharge_kw))
+        # Overrides are flagged as each guard mutates the command, so no
+        # pre-clip copy or post-hoc np.allclose sweep is needed.
+        original_batt = float(safe[0])
+        batt = min(max(original_batt, self._batt_low), self._batt_high)
+        overridden = batt != original_batt
         if safe.size == 2:
-            safe[1] = float(np.clip(safe[1], -g.max_export_kw, g.max_import_kw))
+            original_grid = float(safe[1])
+            grid = min(max(original_grid, self._grid_low), self._grid_high)
+            overridden |= grid != original_grid
+            safe[1] = grid
 
-        # SoC guard rails.
-        if soc <= b.soc_min + 0.01 and safe[0] > 0.0:
-            safe[0] = 0.0
+        # SoC and thermal guard rails as plain boolean terms; any hit zeroes
+        # the battery command.
+        block_discharge = soc <= self._soc_low and batt > 0.0
+        block_charge = soc >= self._soc_high and batt < 0.0
+        block_temp = temp_c >= self._temp_limit_c and batt != 0.0
+        if block_discharge or block_charge or block_temp:
+            batt = 0.0
+            overridden = True
+        safe[0] = batt
+        if not overridden:
+            return SafetyDecision(action=safe, overridden=False, reason="none")
+
+        reasons: list[str] = []
+        if block_discharge:
             reasons.append("blocked_discharge_low_soc")
-        if soc >= b.soc_max - 0.01 and safe[0] < 0.0:
-            safe[0] = 0.0
+        if block_charge:
             reasons.append("blocked_charge_high_soc")
-
-        # Thermal guard rail.
-        if temp_c >= 48.0 and abs(safe[0]) > 0.0:
-            safe[0] = 0.0
+        if block_temp:
             reasons.append("blocked_battery_high_temp")
-
-        overridden = not np.allclose(original, safe, atol=1e-6)
         reason = ",".join(reasons) if reasons else "none"
-        return SafetyDecision(action=safe, overridden=overridden, reason=reason)
+        return SafetyDecision(action=safe, overridden=True, reason=reason)
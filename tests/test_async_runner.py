@@ -0,0 +1,34 @@
+import asyncio
+
+from src.config import MicrogridConfig
+from src.envs.microgrid_env import MicrogridEnv
+from src.evaluation.async_runner import evaluate_policy_async
+from src.evaluation.runner import baseline_policy_fn, evaluate_policy
+
+
+def test_evaluate_policy_async_matches_sequential() -> None:
+    cfg = MicrogridConfig()
+
+    sequential = evaluate_policy(
+        env=MicrogridEnv(cfg),
+        policy_fn=baseline_policy_fn(cfg),
+        policy_name="baseline",
+        episodes=2,
+        seed_start=3,
+        use_safety=True,
+    )
+    concurrent = asyncio.run(
+        evaluate_policy_async(
+            cfg=cfg,
+            policy_spec=("baseline", None),
+            policy_name="baseline",
+            episodes=2,
+            seed_start=3,
+            use_safety=True,
+            max_concurrent=2,
+        )
+    )
+
+    assert concurrent.episodes == sequential.episodes
+    assert abs(concurrent.avg_reward - sequential.avg_reward) < 1e-9
+    assert abs(concurrent.avg_penalty_cost - sequential.avg_penalty_cost) < 1e-9
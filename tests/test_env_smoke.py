@@ -27,3 +27,25 @@ def test_microgrid_env_accepts_legacy_two_dim_action() -> None:
     assert isinstance(float(reward), float)
     assert isinstance(bool(terminated), bool)
     assert isinstance(bool(truncated), bool)
+
+
+def test_rollout_matches_sequential_steps() -> None:
+    cfg = MicrogridConfig()
+    cmds = np.linspace(-30.0, 30.0, cfg.environment.episode_horizon, dtype=np.float64)
+
+    step_env = MicrogridEnv(cfg)
+    step_env.reset(seed=3)
+    step_rewards = []
+    step_soc = []
+    for cmd in cmds:
+        _, reward, _, _, info = step_env.step(np.array([cmd], dtype=np.float32))
+        step_rewards.append(reward)
+        step_soc.append(info["soc"])
+
+    rollout_env = MicrogridEnv(cfg)
+    rollout_env.reset(seed=3)
+    result = rollout_env.rollout(cmds.astype(np.float32))
+
+    assert np.allclose(result["reward"], step_rewards, atol=1e-9)
+    assert np.allclose(result["soc"], step_soc, atol=1e-9)
+    assert rollout_env._t == cfg.environment.episode_horizon
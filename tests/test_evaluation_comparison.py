@@ -1,4 +1,4 @@
-from src.evaluation.comparison import compare_policy_summaries
+from src.evaluation.comparison import compare_many, compare_policy_summaries
 from src.evaluation.runner import EvaluationSummary
 
 
@@ -69,3 +69,41 @@ def test_compare_policy_summaries_directionality() -> None:
     assert metric_map["avg_grid_cost"].improved is True
     assert metric_map["avg_export_kwh"].improved is None
 
+
+def test_compare_many_matches_pairwise_report() -> None:
+    baseline = _summary(
+        policy="baseline",
+        reward=-120.0,
+        grid=100.0,
+        deg=5.0,
+        penalty=15.0,
+        unmet=1.0,
+        curtailed=2.0,
+        imp=80.0,
+        exp=3.0,
+        throughput=50.0,
+        overrides=2.0,
+    )
+    candidate = _summary(
+        policy="sac:model.zip",
+        reward=-90.0,
+        grid=85.0,
+        deg=4.5,
+        penalty=7.0,
+        unmet=0.2,
+        curtailed=1.5,
+        imp=70.0,
+        exp=4.0,
+        throughput=45.0,
+        overrides=1.0,
+    )
+
+    result = compare_many([baseline, candidate])
+    report = compare_policy_summaries(baseline, candidate)
+
+    assert result["values"].shape == (2, 10)
+    reward_idx = list(result["metric_names"]).index("avg_reward")
+    assert result["improved"][0, 1, reward_idx] == report.metrics[0].improved
+    assert abs(
+        result["improvement_pct"][0, 1, reward_idx] - report.metrics[0].improvement_pct
+    ) < 1e-9
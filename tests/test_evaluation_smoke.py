@@ -1,6 +1,11 @@
 from src.config import MicrogridConfig
 from src.envs.microgrid_env import MicrogridEnv
-from src.evaluation.runner import baseline_policy_fn, evaluate_policy
+from src.evaluation.runner import (
+    baseline_policy_fn,
+    evaluate_policy,
+    evaluate_policy_batched,
+    make_eval_envs,
+)
 
 
 def test_evaluate_policy_smoke() -> None:
@@ -21,3 +26,43 @@ def test_evaluate_policy_smoke() -> None:
     assert len(summary.details) == 2
     assert isinstance(summary.avg_reward, float)
 
+
+def test_evaluate_policy_batched_matches_sequential() -> None:
+    cfg = MicrogridConfig()
+    policy = baseline_policy_fn(cfg)
+
+    sequential = evaluate_policy(
+        env=MicrogridEnv(cfg),
+        policy_fn=policy,
+        policy_name="baseline",
+        episodes=3,
+        seed_start=5,
+        use_safety=True,
+    )
+    batched = evaluate_policy_batched(
+        envs=make_eval_envs(cfg, 2),
+        policy_fn=policy,
+        policy_name="baseline",
+        episodes=3,
+        seed_start=5,
+        use_safety=True,
+    )
+
+    assert batched.episodes == sequential.episodes
+    assert len(batched.details) == len(sequential.details)
+    assert abs(batched.avg_reward - sequential.avg_reward) < 1e-9
+    assert abs(batched.avg_grid_cost - sequential.avg_grid_cost) < 1e-9
+
+
+def test_runner_import_does_not_load_rl_stack() -> None:
+    # RL dependencies must stay lazy so baseline/random evaluation never
+    # pays the torch import cost.
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import src.evaluation.runner; "
+        "assert 'torch' not in sys.modules; "
+        "assert 'stable_baselines3' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,6 +1,7 @@
 import pandas as pd
 
-from src.data.profiles import load_profiles_from_csv
+from src.data.profile_cache import ensure_npy, load_profile_matrix
+from src.data.profiles import get_profiles, load_profiles_from_csv
 
 
 def test_load_profiles_derives_export_price_when_missing(tmp_path) -> None:
@@ -17,3 +18,42 @@ def test_load_profiles_derives_export_price_when_missing(tmp_path) -> None:
     profiles = load_profiles_from_csv(csv_path, horizon=2, sell_price_factor=0.8)
     assert abs(float(profiles.price_export_per_kwh[0]) - 0.08) < 1e-6
     assert abs(float(profiles.price_export_per_kwh[1]) - 0.16) < 1e-6
+
+
+def test_get_profiles_shares_cached_csv_load(tmp_path) -> None:
+    frame = pd.DataFrame(
+        {
+            "renewable_kw": [10.0, 20.0, 30.0],
+            "load_kw": [15.0, 25.0, 35.0],
+            "price_import_per_kwh": [0.10, 0.20, 0.30],
+        }
+    )
+    csv_path = tmp_path / "profiles.csv"
+    frame.to_csv(csv_path, index=False)
+
+    first = get_profiles(str(csv_path), horizon=3, dt_hours=0.25, seed=1)
+    second = get_profiles(str(csv_path), horizon=3, dt_hours=0.25, seed=2)
+
+    assert first.renewable_kw is second.renewable_kw
+    assert not first.renewable_kw.flags.writeable
+
+
+def test_ensure_npy_builds_sidecar_once(tmp_path) -> None:
+    frame = pd.DataFrame(
+        {
+            "renewable_kw": [10.0, 20.0],
+            "load_kw": [15.0, 25.0],
+            "price_import_per_kwh": [0.10, 0.20],
+        }
+    )
+    csv_path = tmp_path / "profiles.csv"
+    frame.to_csv(csv_path, index=False)
+
+    npy_path = ensure_npy(csv_path)
+    assert npy_path.exists()
+    first_mtime = npy_path.stat().st_mtime_ns
+    assert ensure_npy(csv_path).stat().st_mtime_ns == first_mtime
+
+    matrix = load_profile_matrix(csv_path)
+    assert matrix.shape == (2, 4)
+    assert not matrix.flags.writeable
@@ -23,3 +23,21 @@ def test_rule_based_controller_charges_on_excess_renewable() -> None:
     action = controller.act(obs)
 
     assert float(action[0]) < 0.0
+
+
+def test_act_batch_matches_scalar_decisions() -> None:
+    cfg = MicrogridConfig()
+    controller = RuleBasedController(cfg)
+
+    rng = np.random.default_rng(0)
+    batch = np.zeros((64, 8), dtype=np.float32)
+    batch[:, 0] = rng.uniform(0.0, 150.0, size=64)
+    batch[:, 2] = rng.uniform(50.0, 150.0, size=64)
+    batch[:, 4] = rng.uniform(0.1, 0.9, size=64)
+    batch[:, 6] = rng.uniform(0.05, 0.25, size=64)
+
+    batched = controller.act_batch(batch)
+    scalar = np.stack([controller.act(row) for row in batch])
+
+    assert batched.shape == (64, 1)
+    assert np.allclose(batched, scalar, atol=1e-6)